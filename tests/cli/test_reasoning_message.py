@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from tests.mock.widget_app import WidgetApp
+from vibe.cli.textual_ui.widgets.messages import ReasoningMessage
+
+
+@pytest.mark.asyncio
+async def test_expanding_reasoning_keeps_content_received_while_collapsed() -> None:
+    message = ReasoningMessage("First thought.", collapsed=True)
+
+    async with WidgetApp(message).run_test() as pilot:
+        await message.write_initial_content()
+        await message.append_content(" Second thought.")
+        await message.set_collapsed(False)
+        await message.set_collapsed(True)
+        await message.append_content(" Third thought.")
+        await message.set_collapsed(False)
+        await message.stop_stream()
+        await pilot.pause()
+
+        assert message._get_markdown().source == (
+            "First thought. Second thought. Third thought."
+        )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_expand_and_append_writes_content_once() -> None:
+    message = ReasoningMessage("ab", collapsed=True)
+
+    async with WidgetApp(message).run_test() as pilot:
+        await message.write_initial_content()
+        await asyncio.gather(message.set_collapsed(False), message.append_content("c"))
+        await message.stop_stream()
+        await pilot.pause()
+
+        assert message._get_markdown().source == "abc"
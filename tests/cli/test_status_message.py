@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from tests.mock.widget_app import WidgetApp
+from vibe.cli.textual_ui.widgets.tools import ToolCallMessage
+from vibe.core.tools.builtins.read_file import ReadFile, ReadFileArgs
+from vibe.core.types import ToolCallEvent
+
+
+def _live_tool_call() -> ToolCallMessage:
+    return ToolCallMessage(
+        ToolCallEvent(
+            tool_name="read_file",
+            tool_class=ReadFile,
+            args=ReadFileArgs(path="README.md"),
+            tool_call_id="call_1",
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_history_tool_call_does_not_start_a_spinner_timer() -> None:
+    tool_call = ToolCallMessage(tool_name="read_file")
+
+    async with WidgetApp(tool_call).run_test() as pilot:
+        await pilot.pause()
+
+        assert tool_call._spinner_timer is None
+
+
+@pytest.mark.asyncio
+async def test_stopped_tool_call_releases_its_spinner_timer() -> None:
+    tool_call = _live_tool_call()
+
+    async with WidgetApp(tool_call).run_test() as pilot:
+        await pilot.pause()
+        assert tool_call._spinner_timer is not None
+
+        tool_call.stop_spinning()
+
+        assert tool_call._spinner_timer is None
+
+
+@pytest.mark.asyncio
+async def test_spinner_tick_leaves_unchanged_text_alone(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tool_call = _live_tool_call()
+
+    async with WidgetApp(tool_call).run_test() as pilot:
+        await pilot.pause()
+        text_widget = tool_call._text_widget
+        assert text_widget is not None
+        update = MagicMock(wraps=text_widget.update)
+        monkeypatch.setattr(text_widget, "update", update)
+
+        tool_call.update_display()
+        tool_call.update_display()
+
+        update.assert_not_called()
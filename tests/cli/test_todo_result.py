@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from textual.containers import Vertical
+
+from tests.mock.widget_app import WidgetApp
+from vibe.cli.textual_ui.handlers.event_handler import EventHandler
+from vibe.cli.textual_ui.widgets.tool_widgets import TodoResultWidget
+from vibe.cli.textual_ui.widgets.tools import ToolResultMessage
+from vibe.core.tools.builtins.todo import Todo, TodoItem, TodoResult
+from vibe.core.types import ToolResultEvent
+
+
+@pytest.mark.asyncio
+async def test_todo_result_reuses_the_mounted_widget() -> None:
+    todo_area = Vertical(id="todo-area")
+    handler = EventHandler(
+        mount_callback=AsyncMock(),
+        scroll_callback=MagicMock(),
+        todo_area_callback=lambda: todo_area,
+        get_tools_collapsed=lambda: False,
+        get_todos_collapsed=lambda: False,
+    )
+    result = TodoResult(
+        message="Updated 1 todos",
+        todos=[TodoItem(id="1", content="Write tests")],
+        total_count=1,
+    )
+
+    async with WidgetApp(todo_area).run_test() as pilot:
+        await handler.handle_event(
+            ToolResultEvent(
+                tool_name="todo",
+                tool_class=Todo,
+                error="Invalid todos",
+                tool_call_id="call_1",
+            )
+        )
+        await pilot.pause()
+        first = todo_area.query_one(ToolResultMessage)
+        assert first.has_class("error-text")
+
+        await handler.handle_event(
+            ToolResultEvent(
+                tool_name="todo", tool_class=Todo, result=result, tool_call_id="call_2"
+            )
+        )
+        await pilot.pause()
+
+        assert list(todo_area.children) == [first]
+        assert not first.has_class("error-text")
+        todo_widget = first.query_one(TodoResultWidget)
+        assert todo_widget.result == result
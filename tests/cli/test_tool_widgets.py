@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+
+from vibe.cli.textual_ui.widgets.tool_widgets import _truncate_lines
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["", "one", "one\ntwo\nthree", "one\ntwo\nthree\n", "\n\n\n\n", "a\nb\nc\nd\ne"],
+)
+def test_truncate_lines_keeps_content_within_the_limit(content: str) -> None:
+    assert _truncate_lines(content, 5) == content
+
+
+def test_truncate_lines_reports_the_number_of_hidden_lines() -> None:
+    content = "\n".join(f"line {i}" for i in range(1, 11))
+
+    assert _truncate_lines(content, 3) == "line 1\nline 2\nline 3\n… (7 more lines)"
+
+
+def test_truncate_lines_counts_a_trailing_empty_line() -> None:
+    assert _truncate_lines("a\nb\nc\n", 2) == "a\nb\n… (2 more lines)"
+
+
+@pytest.mark.parametrize(
+    ("content", "max_lines", "expected"),
+    [
+        ("a\nb", 0, "… (2 more lines)"),
+        ("", 0, "… (1 more lines)"),
+        ("a\nb\nc", -1, "… (3 more lines)"),
+    ],
+)
+def test_truncate_lines_without_room_hides_every_line(
+    content: str, max_lines: int, expected: str
+) -> None:
+    assert _truncate_lines(content, max_lines) == expected
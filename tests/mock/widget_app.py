@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from textual.app import App, ComposeResult
+from textual.widget import Widget
+
+
+class WidgetApp(App):
+    """Minimal app that mounts the given widgets, for testing them in isolation."""
+
+    def __init__(self, *widgets: Widget) -> None:
+        super().__init__()
+        self._widgets = widgets
+
+    def compose(self) -> ComposeResult:
+        yield from self._widgets
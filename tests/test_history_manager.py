@@ -42,6 +42,19 @@ def test_history_manager_retains_a_fixed_number_of_entries(tmp_path: Path) -> No
     assert reloaded.get_previous(current_input="", prefix="") is None
 
 
+def test_history_manager_loads_only_the_most_recent_entries(tmp_path: Path) -> None:
+    history_file = tmp_path / "history.jsonl"
+    history_file.write_text(
+        "".join(json.dumps(f"entry {i}") + "\n" for i in range(1000)), encoding="utf-8"
+    )
+
+    manager = HistoryManager(history_file, max_entries=2)
+
+    assert manager.get_previous(current_input="", prefix="") == "entry 999"
+    assert manager.get_previous(current_input="", prefix="") == "entry 998"
+    assert manager.get_previous(current_input="", prefix="") is None
+
+
 def test_history_manager_filters_invalid_and_duplicated_entries(tmp_path: Path) -> None:
     history_file = tmp_path / "history.jsonl"
     manager = HistoryManager(history_file, max_entries=5)
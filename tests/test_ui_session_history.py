@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pytest
+
+from vibe.cli.textual_ui.app import VibeApp
+from vibe.cli.textual_ui.widgets.messages import AssistantMessage, UserMessage
+from vibe.cli.textual_ui.widgets.tools import ToolCallMessage, ToolResultMessage
+from vibe.core.config import SessionLoggingConfig, VibeConfig
+from vibe.core.types import FunctionCall, LLMMessage, Role, ToolCall
+
+
+@pytest.fixture
+def vibe_config() -> VibeConfig:
+    return VibeConfig(
+        session_logging=SessionLoggingConfig(enabled=False), enable_update_checks=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_rebuilds_loaded_history_in_order(vibe_config: VibeConfig) -> None:
+    loaded_messages = [
+        LLMMessage(role=Role.system, content="system prompt"),
+        LLMMessage(role=Role.user, content="Read the readme"),
+        LLMMessage(
+            role=Role.assistant,
+            content="Reading it now.",
+            tool_calls=[ToolCall(id="call_1", function=FunctionCall(name="read_file"))],
+        ),
+        LLMMessage(role=Role.tool, tool_call_id="call_1", content="# Readme"),
+        LLMMessage(role=Role.assistant, content="It is a readme."),
+    ]
+    vibe_app = VibeApp(config=vibe_config, loaded_messages=loaded_messages)
+
+    async with vibe_app.run_test() as pilot:
+        await pilot.pause()
+
+        children = list(vibe_app.query_one("#messages").children)
+        assert [type(child) for child in children] == [
+            UserMessage,
+            AssistantMessage,
+            ToolCallMessage,
+            ToolResultMessage,
+            AssistantMessage,
+        ]
+        tool_result = children[3]
+        assert isinstance(tool_result, ToolResultMessage)
+        assert tool_result.tool_name == "read_file"
+        last_message = children[4]
+        assert isinstance(last_message, AssistantMessage)
+        assert last_message._get_markdown().source == "It is a readme."
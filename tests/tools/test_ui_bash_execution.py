@@ -1,15 +1,25 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncGenerator
 from pathlib import Path
 import time
+from types import SimpleNamespace
 
 import pytest
 from textual.widgets import Static
 
 from vibe.cli.textual_ui.app import VibeApp
 from vibe.cli.textual_ui.widgets.chat_input.container import ChatInputContainer
-from vibe.cli.textual_ui.widgets.messages import BashOutputMessage, ErrorMessage
+from vibe.cli.textual_ui.widgets.messages import (
+    AssistantMessage,
+    BashOutputMessage,
+    ErrorMessage,
+    UserMessage,
+)
+from vibe.core.agent import Agent
 from vibe.core.config import SessionLoggingConfig, VibeConfig
+from vibe.core.types import AssistantEvent, BaseEvent
 
 
 @pytest.fixture
@@ -25,11 +35,12 @@ def vibe_app(vibe_config: VibeConfig) -> VibeApp:
 
 
 async def _wait_for_bash_output_message(
-    vibe_app: VibeApp, pilot, timeout: float = 1.0
+    vibe_app: VibeApp, pilot, timeout: float = 5.0
 ) -> BashOutputMessage:
     deadline = time.monotonic() + timeout
     while time.monotonic() < deadline:
-        if message := next(iter(vibe_app.query(BashOutputMessage)), None):
+        message = next(iter(vibe_app.query(BashOutputMessage)), None)
+        if message is not None and message.is_mounted:
             return message
         await pilot.pause(0.05)
     raise TimeoutError(f"BashOutputMessage did not appear within {timeout}s")
@@ -136,3 +147,91 @@ async def test_ui_handles_non_utf8_stderr(vibe_app: VibeApp) -> None:
         output_widget = message.query_one(".bash-output", Static)
         assert str(output_widget.render()) == "��"
         assert_no_command_error(vibe_app)
+
+
+@pytest.mark.asyncio
+async def test_ui_accepts_input_while_command_runs(vibe_app: VibeApp) -> None:
+    async with vibe_app.run_test() as pilot:
+        chat_input = vibe_app.query_one(ChatInputContainer)
+        chat_input.value = "!sleep 1"
+
+        await pilot.press("enter")
+        await pilot.press("h", "i")
+
+        assert chat_input.value == "hi"
+        assert not list(vibe_app.query(BashOutputMessage))
+        await _wait_for_bash_output_message(vibe_app, pilot)
+        assert_no_command_error(vibe_app)
+
+
+@pytest.mark.asyncio
+async def test_ui_shows_outputs_in_submission_order(vibe_app: VibeApp) -> None:
+    async with vibe_app.run_test() as pilot:
+        chat_input = vibe_app.query_one(ChatInputContainer)
+        chat_input.value = "!sleep 0.5; echo first"
+        await pilot.press("enter")
+        chat_input.value = "!echo second"
+        await pilot.press("enter")
+
+        deadline = time.monotonic() + 5.0
+        while len(vibe_app.query(BashOutputMessage)) < 2:
+            assert time.monotonic() < deadline, "bash outputs did not appear"
+            await pilot.pause(0.05)
+        await pilot.pause()
+
+        outputs = [
+            str(message.query_one(".bash-output", Static).render())
+            for message in vibe_app.query(BashOutputMessage)
+        ]
+        assert outputs == ["first\n", "second\n"]
+
+
+class PausingAgent(Agent):
+    def __init__(self, config: VibeConfig, resume: asyncio.Event) -> None:
+        self.config = config
+        self.messages: list = []
+        self.stats = SimpleNamespace(context_tokens=0)
+        self.approval_callback = None
+        self._resume = resume
+
+    async def initialize(self) -> None:
+        return
+
+    async def act(self, msg: str) -> AsyncGenerator[BaseEvent]:
+        yield AssistantEvent(content="Hello")
+        await self._resume.wait()
+        yield AssistantEvent(content=" world")
+
+
+@pytest.mark.asyncio
+async def test_ui_keeps_streaming_reply_whole_when_command_finishes(
+    vibe_config: VibeConfig,
+) -> None:
+    resume = asyncio.Event()
+    vibe_app = VibeApp(config=vibe_config)
+    vibe_app.agent = PausingAgent(vibe_config, resume)
+
+    async with vibe_app.run_test() as pilot:
+        chat_input = vibe_app.query_one(ChatInputContainer)
+        chat_input.value = "!sleep 0.5"
+        await pilot.press("enter")
+        chat_input.value = "Say hello"
+        await pilot.press("enter")
+
+        await _wait_for_bash_output_message(vibe_app, pilot)
+        resume.set()
+        deadline = time.monotonic() + 5.0
+        while vibe_app._agent_running:
+            assert time.monotonic() < deadline, "agent turn did not finish"
+            await pilot.pause(0.05)
+        await pilot.pause()
+
+        children = list(vibe_app.query_one("#messages").children)
+        assert [type(child) for child in children] == [
+            BashOutputMessage,
+            UserMessage,
+            AssistantMessage,
+        ]
+        reply = children[2]
+        assert isinstance(reply, AssistantMessage)
+        assert reply._get_markdown().source == "Hello world"
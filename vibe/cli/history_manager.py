@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import deque
 import json
 from pathlib import Path
 
@@ -19,7 +20,7 @@ class HistoryManager:
 
         try:
             with self.history_file.open("r", encoding="utf-8") as f:
-                entries = []
+                entries: deque[str] = deque(maxlen=self.max_entries)
                 for raw_line in f:
                     raw_line = raw_line.rstrip("\n\r")
                     if not raw_line:
@@ -29,7 +30,7 @@ class HistoryManager:
                     except json.JSONDecodeError:
                         entry = raw_line
                     entries.append(entry if isinstance(entry, str) else str(entry))
-                self._entries = entries[-self.max_entries :]
+                self._entries = list(entries)
         except (OSError, UnicodeDecodeError):
             self._entries = []
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 from enum import StrEnum, auto
 import json
 from pathlib import Path
@@ -149,6 +150,8 @@ class VibeApp(App):  # noqa: PLR0904
         # completes exactly at the moment the user interrupts
         self._agent_init_interrupted = False
         self._auto_scroll = True
+        self._deferred_callbacks: set[Callable[[], None]] = set()
+        self._bash_lock = asyncio.Lock()
         self._last_escape_time: float | None = None
         self._terminal_theme = capture_terminal_theme()
 
@@ -242,7 +245,12 @@ class VibeApp(App):  # noqa: PLR0904
             await self._interrupt_agent()
 
         if value.startswith("!"):
-            await self._handle_bash_command(value[1:])
+            # Reserve the output's place now so it lands in submission order
+            placeholder = Widget(classes="bash-output-placeholder")
+            await self._mount_and_scroll(placeholder)
+            self.run_worker(
+                self._handle_bash_command(value[1:], placeholder), exclusive=False
+            )
             return
 
         if await self._handle_command(value):
@@ -382,48 +390,66 @@ class VibeApp(App):  # noqa: PLR0904
             return True
         return False
 
-    async def _handle_bash_command(self, command: str) -> None:
+    async def _handle_bash_command(self, command: str, placeholder: Widget) -> None:
         if not command:
-            await self._mount_and_scroll(
+            await self._replace_placeholder(
+                placeholder,
                 ErrorMessage(
                     "No command provided after '!'", collapsed=self._tools_collapsed
-                )
+                ),
             )
             return
 
-        try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=False,
-                timeout=30,
-                cwd=self.config.effective_workdir,
-            )
-            stdout = (
-                result.stdout.decode("utf-8", errors="replace") if result.stdout else ""
-            )
-            stderr = (
-                result.stderr.decode("utf-8", errors="replace") if result.stderr else ""
-            )
-            output = stdout or stderr or "(no output)"
-            exit_code = result.returncode
-            await self._mount_and_scroll(
-                BashOutputMessage(
+        widget: Widget
+        async with self._bash_lock:
+            try:
+                result = await asyncio.to_thread(
+                    subprocess.run,
+                    command,
+                    shell=True,
+                    capture_output=True,
+                    text=False,
+                    timeout=30,
+                    cwd=self.config.effective_workdir,
+                )
+                stdout = (
+                    result.stdout.decode("utf-8", errors="replace")
+                    if result.stdout
+                    else ""
+                )
+                stderr = (
+                    result.stderr.decode("utf-8", errors="replace")
+                    if result.stderr
+                    else ""
+                )
+                output = stdout or stderr or "(no output)"
+                exit_code = result.returncode
+                widget = BashOutputMessage(
                     command, str(self.config.effective_workdir), output, exit_code
                 )
-            )
-        except subprocess.TimeoutExpired:
-            await self._mount_and_scroll(
-                ErrorMessage(
+            except subprocess.TimeoutExpired:
+                widget = ErrorMessage(
                     "Command timed out after 30 seconds",
                     collapsed=self._tools_collapsed,
                 )
-            )
-        except Exception as e:
-            await self._mount_and_scroll(
-                ErrorMessage(f"Command failed: {e}", collapsed=self._tools_collapsed)
-            )
+            except Exception as e:
+                widget = ErrorMessage(
+                    f"Command failed: {e}", collapsed=self._tools_collapsed
+                )
+
+        await self._replace_placeholder(placeholder, widget)
+
+    async def _replace_placeholder(self, placeholder: Widget, widget: Widget) -> None:
+        # Mount in place rather than through _mount_and_scroll so a reply that is
+        # streaming meanwhile is not finalized and split around this widget
+        if not placeholder.is_attached:
+            return
+        chat = self.query_one("#chat", VerticalScroll)
+        was_at_bottom = self._is_scrolled_to_bottom(chat)
+        await self.query_one("#messages").mount(widget, before=placeholder)
+        await placeholder.remove()
+        if was_at_bottom:
+            self._scroll_to_bottom_deferred()
 
     async def _handle_user_message(self, message: str) -> None:
         init_task = self._ensure_agent_init_task()
@@ -523,6 +549,7 @@ class VibeApp(App):  # noqa: PLR0904
 
         messages_area = self.query_one("#messages")
         tool_call_map: dict[str, str] = {}
+        widgets: list[Widget] = []
 
         for msg in self._loaded_messages:
             if msg.role == Role.system:
@@ -531,18 +558,16 @@ class VibeApp(App):  # noqa: PLR0904
             match msg.role:
                 case Role.user:
                     if msg.content:
-                        await messages_area.mount(UserMessage(msg.content))
+                        widgets.append(UserMessage(msg.content))
 
                 case Role.assistant:
-                    await self._mount_history_assistant_message(
-                        msg, messages_area, tool_call_map
-                    )
+                    widgets.extend(self._history_assistant_widgets(msg, tool_call_map))
 
                 case Role.tool:
                     tool_name = msg.name or tool_call_map.get(
                         msg.tool_call_id or "", "tool"
                     )
-                    await messages_area.mount(
+                    widgets.append(
                         ToolResultMessage(
                             tool_name=tool_name,
                             content=msg.content,
@@ -550,24 +575,31 @@ class VibeApp(App):  # noqa: PLR0904
                         )
                     )
 
-    async def _mount_history_assistant_message(
-        self, msg: LLMMessage, messages_area: Widget, tool_call_map: dict[str, str]
-    ) -> None:
-        if msg.content:
-            widget = AssistantMessage(msg.content)
-            await messages_area.mount(widget)
-            await widget.write_initial_content()
-            await widget.stop_stream()
-
-        if not msg.tool_calls:
+        if not widgets:
             return
 
-        for tool_call in msg.tool_calls:
+        await messages_area.mount_all(widgets)
+
+        for widget in widgets:
+            if isinstance(widget, AssistantMessage):
+                await widget.write_initial_content()
+                await widget.stop_stream()
+
+    def _history_assistant_widgets(
+        self, msg: LLMMessage, tool_call_map: dict[str, str]
+    ) -> list[Widget]:
+        widgets: list[Widget] = []
+        if msg.content:
+            widgets.append(AssistantMessage(msg.content))
+
+        for tool_call in msg.tool_calls or []:
             tool_name = tool_call.function.name or "unknown"
             if tool_call.id:
                 tool_call_map[tool_call.id] = tool_name
 
-            await messages_area.mount(ToolCallMessage(tool_name=tool_name))
+            widgets.append(ToolCallMessage(tool_name=tool_name))
+
+        return widgets
 
     def _ensure_agent_init_task(self) -> asyncio.Task | None:
         if self.agent:
@@ -796,10 +828,7 @@ class VibeApp(App):  # noqa: PLR0904
         # Clear UI areas
         try:
             await self._finalize_current_streaming_message()
-            messages_area = self.query_one("#messages")
-            await messages_area.remove_children()
-            todo_area = self.query_one("#todo-area")
-            await todo_area.remove_children()
+            await self._clear_chat_areas()
         except Exception:
             pass
 
@@ -899,10 +928,7 @@ class VibeApp(App):  # noqa: PLR0904
         try:
             await self.agent.clear_history()
             await self._finalize_current_streaming_message()
-            messages_area = self.query_one("#messages")
-            await messages_area.remove_children()
-            todo_area = self.query_one("#todo-area")
-            await todo_area.remove_children()
+            await self._clear_chat_areas()
 
             if self._context_progress and self.agent:
                 current_state = self._context_progress.tokens
@@ -910,6 +936,7 @@ class VibeApp(App):  # noqa: PLR0904
                     max_tokens=current_state.max_tokens,
                     current_tokens=self.agent.stats.context_tokens,
                 )
+            messages_area = self.query_one("#messages")
             await messages_area.mount(UserMessage("/clear"))
             await self._mount_and_scroll(
                 UserCommandMessage("Conversation history cleared!")
@@ -924,6 +951,13 @@ class VibeApp(App):  # noqa: PLR0904
                 )
             )
 
+    async def _clear_chat_areas(self) -> None:
+        messages_area = self.query_one("#messages")
+        todo_area = self.query_one("#todo-area")
+        await asyncio.gather(
+            messages_area.remove_children(), todo_area.remove_children()
+        )
+
     async def _show_log_path(self) -> None:
         if self.agent is None:
             await self._mount_and_scroll(
@@ -1144,7 +1178,7 @@ class VibeApp(App):  # noqa: PLR0904
         self._current_bottom_app = BottomApp.Approval
 
         self.call_after_refresh(approval_app.focus)
-        self.call_after_refresh(self._scroll_to_bottom)
+        self._scroll_to_bottom_deferred()
 
     async def _switch_to_input_app(self) -> None:
         bottom_container = self.query_one("#bottom-app-container")
@@ -1250,14 +1284,10 @@ class VibeApp(App):  # noqa: PLR0904
             except Exception:
                 pass
 
-        has_pending_user_message = any(
-            msg.has_class("pending") for msg in self.query(UserMessage)
-        )
-
         interrupt_needed = self._agent_running or (
             self._agent_init_task
             and not self._agent_init_task.done()
-            and has_pending_user_message
+            and self._has_pending_user_message()
         )
 
         if interrupt_needed:
@@ -1267,18 +1297,25 @@ class VibeApp(App):  # noqa: PLR0904
         self._scroll_to_bottom()
         self._focus_current_bottom_app()
 
+    def _has_pending_user_message(self) -> bool:
+        messages_area = self.query_one("#messages")
+        return any(
+            isinstance(widget, UserMessage) and widget.has_class("pending")
+            for widget in messages_area.children
+        )
+
     async def action_toggle_tool(self) -> None:
         self._tools_collapsed = not self._tools_collapsed
 
-        for result in self.query(ToolResultMessage):
-            if result.tool_name != "todo":
-                await result.set_collapsed(self._tools_collapsed)
-
-        try:
-            for error_msg in self.query(ErrorMessage):
-                error_msg.set_collapsed(self._tools_collapsed)
-        except Exception:
-            pass
+        # Tool results and errors are always direct children of the messages
+        # area, so one pass over it avoids walking every message's subtree
+        messages_area = self.query_one("#messages")
+        for widget in list(messages_area.children):
+            match widget:
+                case ToolResultMessage() if widget.tool_name != "todo":
+                    await widget.set_collapsed(self._tools_collapsed)
+                case ErrorMessage():
+                    widget.set_collapsed(self._tools_collapsed)
 
     async def action_toggle_todo(self) -> None:
         self._todos_collapsed = not self._todos_collapsed
@@ -1444,10 +1481,10 @@ class VibeApp(App):  # noqa: PLR0904
             is_tool_message = isinstance(widget, (ToolCallMessage, ToolResultMessage))
 
             if not is_tool_message:
-                self.call_after_refresh(self._scroll_to_bottom)
+                self._scroll_to_bottom_deferred()
 
         if was_at_bottom:
-            self.call_after_refresh(self._anchor_if_scrollable)
+            self._call_after_refresh_once(self._anchor_if_scrollable)
 
     def _is_scrolled_to_bottom(self, scroll_view: VerticalScroll) -> bool:
         try:
@@ -1464,7 +1501,17 @@ class VibeApp(App):  # noqa: PLR0904
             pass
 
     def _scroll_to_bottom_deferred(self) -> None:
-        self.call_after_refresh(self._scroll_to_bottom)
+        self._call_after_refresh_once(self._scroll_to_bottom)
+
+    def _call_after_refresh_once(self, callback: Callable[[], None]) -> None:
+        if callback in self._deferred_callbacks:
+            return
+        self._deferred_callbacks.add(callback)
+        self.call_after_refresh(self._run_deferred_callback, callback)
+
+    def _run_deferred_callback(self, callback: Callable[[], None]) -> None:
+        self._deferred_callbacks.discard(callback)
+        callback()
 
     def _anchor_if_scrollable(self) -> None:
         if not self._auto_scroll:
@@ -104,13 +104,18 @@ class EventHandler:
     async def _handle_tool_result(self, event: ToolResultEvent) -> None:
         if event.tool_name == "todo":
             todos_collapsed = self.get_todos_collapsed()
-            tool_result = ToolResultMessage(
-                event, self.current_tool_call, collapsed=todos_collapsed
-            )
-            # Show in todo area
+            # Show in todo area, reusing the mounted result when there is one
             todo_area = self.todo_area_callback()
-            await todo_area.remove_children()
-            await todo_area.mount(tool_result)
+            match todo_area.children:
+                case [ToolResultMessage() as tool_result]:
+                    tool_result.collapsed = todos_collapsed
+                    await tool_result.update_result(event, self.current_tool_call)
+                case _:
+                    tool_result = ToolResultMessage(
+                        event, self.current_tool_call, collapsed=todos_collapsed
+                    )
+                    await todo_area.remove_children()
+                    await todo_area.mount(tool_result)
         else:
             tools_collapsed = self.get_tools_collapsed()
             tool_result = ToolResultMessage(
@@ -5,6 +5,7 @@ import random
 from time import time
 from typing import ClassVar
 
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.widgets import Static
@@ -55,10 +56,11 @@ class LoadingWidget(SpinnerMixin, Static):
         self.status = status or self._get_default_status()
         self.current_color_index = 0
         self.transition_progress = 0
-        self.char_widgets: list[Static] = []
+        self.status_widget: Static | None = None
         self.ellipsis_widget: Static | None = None
         self.hint_widget: Static | None = None
         self.start_time: float | None = None
+        self._displayed_elapsed: int | None = None
 
     def _get_easter_egg(self) -> str | None:
         EASTER_EGG_PROBABILITY = 0.10
@@ -85,7 +87,8 @@ class LoadingWidget(SpinnerMixin, Static):
 
     def set_status(self, status: str) -> None:
         self.status = self._apply_easter_egg(status)
-        self._rebuild_chars()
+        if self.is_mounted:
+            self._update_animation()
 
     def compose(self) -> ComposeResult:
         with Horizontal(classes="loading-container"):
@@ -94,11 +97,8 @@ class LoadingWidget(SpinnerMixin, Static):
             )
             yield self._indicator_widget
 
-            with Horizontal(classes="loading-status"):
-                for char in self.status:
-                    widget = Static(char, classes="loading-char")
-                    self.char_widgets.append(widget)
-                    yield widget
+            self.status_widget = Static("", classes="loading-status")
+            yield self.status_widget
 
             self.ellipsis_widget = Static("… ", classes="loading-ellipsis")
             yield self.ellipsis_widget
@@ -106,22 +106,6 @@ class LoadingWidget(SpinnerMixin, Static):
             self.hint_widget = Static("(0s esc to interrupt)", classes="loading-hint")
             yield self.hint_widget
 
-    def _rebuild_chars(self) -> None:
-        if not self.is_mounted:
-            return
-
-        status_container = self.query_one(".loading-status", Horizontal)
-
-        status_container.remove_children()
-        self.char_widgets.clear()
-
-        for char in self.status:
-            widget = Static(char, classes="loading-char")
-            self.char_widgets.append(widget)
-            status_container.mount(widget)
-
-        self._update_animation()
-
     def on_mount(self) -> None:
         self.start_time = time()
         self._update_animation()
@@ -145,17 +129,18 @@ class LoadingWidget(SpinnerMixin, Static):
         return current_color
 
     def _update_animation(self) -> None:
-        total_elements = 1 + len(self.char_widgets) + 2
+        total_elements = 1 + len(self.status) + 2
 
         if self._indicator_widget:
             spinner_char = self._spinner.next_frame()
             color = self._get_color_for_position(0)
             self._indicator_widget.update(f"[{color}]{spinner_char}[/]")
 
-        for i, widget in enumerate(self.char_widgets):
-            position = 1 + i
-            color = self._get_color_for_position(position)
-            widget.update(f"[{color}]{self.status[i]}[/]")
+        if self.status_widget:
+            status_text = Text()
+            for i, char in enumerate(self.status):
+                status_text.append(char, style=self._get_color_for_position(1 + i))
+            self.status_widget.update(status_text)
 
         if self.ellipsis_widget:
             ellipsis_start = 1 + len(self.status)
@@ -172,4 +157,6 @@ class LoadingWidget(SpinnerMixin, Static):
 
         if self.hint_widget and self.start_time is not None:
             elapsed = int(time() - self.start_time)
-            self.hint_widget.update(f"({elapsed}s esc to interrupt)")
+            if elapsed != self._displayed_elapsed:
+                self._displayed_elapsed = elapsed
+                self.hint_widget.update(f"({elapsed}s esc to interrupt)")
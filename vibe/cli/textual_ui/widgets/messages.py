@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 from textual.app import ComposeResult
@@ -23,13 +24,17 @@ class NonSelectableStatic(Static):
         return None
 
 
+@lru_cache(maxsize=64)
+def _border_text(height: int) -> str:
+    return "⎢\n" * max(height - 1, 0) + "⎣"
+
+
 class ExpandingBorder(NonSelectableStatic):
-    def render(self) -> str:
-        height = self.size.height
-        return "\n".join(["⎢"] * (height - 1) + ["⎣"])
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(_border_text(1), markup=False, **kwargs)
 
     def on_resize(self) -> None:
-        self.refresh()
+        self.update(_border_text(self.size.height))
 
 
 class UserMessage(Static):
@@ -63,6 +68,7 @@ class StreamingMessageBase(Static):
     def __init__(self, content: str) -> None:
         super().__init__()
         self._content = content
+        self._written_length = 0
         self._markdown: Markdown | None = None
         self._stream: MarkdownStream | None = None
 
@@ -83,14 +89,21 @@ class StreamingMessageBase(Static):
             return
 
         self._content += content
-        if self._should_write_content():
-            stream = self._ensure_stream()
-            await stream.write(content)
+        await self._write_pending_content()
 
     async def write_initial_content(self) -> None:
-        if self._content and self._should_write_content():
-            stream = self._ensure_stream()
-            await stream.write(self._content)
+        await self._write_pending_content()
+
+    async def _write_pending_content(self) -> None:
+        if self._written_length == len(self._content):
+            return
+        if not self._should_write_content():
+            return
+
+        stream = self._ensure_stream()
+        pending = self._content[self._written_length :]
+        self._written_length = len(self._content)
+        await stream.write(pending)
 
     async def stop_stream(self) -> None:
         if self._stream is None:
@@ -174,13 +187,8 @@ class ReasoningMessage(SpinnerMixin, StreamingMessageBase):
             self._triangle_widget.update("▶" if collapsed else "▼")
         if self._markdown:
             self._markdown.display = not collapsed
-            if not collapsed and self._content:
-                if self._stream is not None:
-                    await self._stream.stop()
-                    self._stream = None
-                await self._markdown.update("")
-                stream = self._ensure_stream()
-                await stream.write(self._content)
+            if not collapsed:
+                await self._write_pending_content()
 
 
 class UserCommandMessage(Static):
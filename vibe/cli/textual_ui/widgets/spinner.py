@@ -122,6 +122,8 @@ class SpinnerMixin:
             raise TypeError(
                 "SpinnerMixin requires a class that implements HasSetInterval protocol"
             )
+        if not self._is_spinning or self._spinner_timer is not None:
+            return
         self._spinner_timer = self.set_interval(0.1, self._update_spinner_frame)
 
     def _update_spinner_frame(self) -> None:
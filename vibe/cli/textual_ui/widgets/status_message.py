@@ -17,6 +17,7 @@ class StatusMessage(SpinnerMixin, Static):
         self._initial_text = initial_text
         self._indicator_widget: Static | None = None
         self._text_widget: Static | None = None
+        self._displayed_content: str | None = None
         self.success = True
         self.init_spinner()
         super().__init__(**kwargs)
@@ -65,7 +66,9 @@ class StatusMessage(SpinnerMixin, Static):
             self._indicator_widget.add_class("error")
             self._indicator_widget.remove_class("success")
 
-        self._text_widget.update(content)
+        if content != self._displayed_content:
+            self._displayed_content = content
+            self._text_widget.update(content)
 
     def get_content(self) -> str:
         return self._initial_text
@@ -23,11 +23,15 @@ from vibe.core.tools.builtins.write_file import WriteFileArgs, WriteFileResult
 
 def _truncate_lines(content: str, max_lines: int) -> str:
     """Truncate content to max_lines, adding indicator if truncated."""
-    lines = content.split("\n")
-    if len(lines) <= max_lines:
-        return content
-    remaining = len(lines) - max_lines
-    return "\n".join(lines[:max_lines] + [f"… ({remaining} more lines)"])
+    if max_lines <= 0:
+        return f"… ({content.count('\n') + 1} more lines)"
+    end = -1
+    for _ in range(max_lines):
+        end = content.find("\n", end + 1)
+        if end == -1:
+            return content
+    remaining = content.count("\n", end)
+    return f"{content[:end]}\n… ({remaining} more lines)"
 
 
 def parse_search_replace_to_diff(content: str) -> list[str]:
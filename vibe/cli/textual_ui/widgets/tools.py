@@ -22,6 +22,7 @@ class ToolCallMessage(StatusMessage):
         self._event = event
         self._tool_name = tool_name or (event.tool_name if event else "unknown")
         self._is_history = event is None
+        self._summary: str | None = None
 
         super().__init__()
         self.add_class("tool-call")
@@ -30,6 +31,11 @@ class ToolCallMessage(StatusMessage):
             self._is_spinning = False
 
     def get_content(self) -> str:
+        if self._summary is None:
+            self._summary = self._build_summary()
+        return self._summary
+
+    def _build_summary(self) -> str:
         if self._event and self._event.tool_class:
             adapter = ToolUIDataAdapter(self._event.tool_class)
             display = adapter.get_call_display(self._event)
@@ -78,18 +84,31 @@ class ToolResultMessage(Static):
             yield self._content_container
 
     async def on_mount(self) -> None:
+        self._stop_call_spinner()
+        await self._render_result()
+
+    async def update_result(
+        self, event: ToolResultEvent, call_widget: ToolCallMessage | None = None
+    ) -> None:
+        self._event = event
+        self._call_widget = call_widget
+        self._stop_call_spinner()
+        await self._render_result()
+
+    def _stop_call_spinner(self) -> None:
         if self._call_widget:
             success = self._event is None or (
                 not self._event.error and not self._event.skipped
             )
             self._call_widget.stop_spinning(success=success)
-        await self._render_result()
 
     async def _render_result(self) -> None:
         if self._content_container is None:
             return
 
         await self._content_container.remove_children()
+        self.remove_class("error-text")
+        self.remove_class("warning-text")
 
         if self._event is None:
             await self._render_simple()
@@ -120,9 +139,6 @@ class ToolResultMessage(Static):
                 )
             return
 
-        self.remove_class("error-text")
-        self.remove_class("warning-text")
-
         if self._event.tool_class is None:
             await self._render_simple()
             return
@@ -33,7 +33,7 @@ def interpolate_color(
     return rgb_to_hex(r, g, b)
 
 
-@dataclass
+@dataclass(slots=True)
 class LineAnimationState:
     progress: float = 0.0
     cached_color: str | None = None
@@ -177,13 +177,15 @@ class WelcomeBanner(Static):
 
     def _advance_line_progress(self, elapsed: float) -> bool:
         any_updates = False
-        for line_idx, state in enumerate(self._line_states):
+        line_duration = self._line_duration
+        for state, start_time in zip(
+            self._line_states, self._line_start_times, strict=True
+        ):
             if state.progress >= 1.0:
                 continue
-            start_time = self._line_start_times[line_idx]
             if elapsed < start_time:
                 continue
-            progress = min(1.0, (elapsed - start_time) / self._line_duration)
+            progress = min(1.0, (elapsed - start_time) / line_duration)
             if progress > state.progress:
                 state.progress = progress
                 any_updates = True